@@ -6,10 +6,10 @@ __version__ = '0.4.0'
 
 import datetime as dt
 import os
+from concurrent.futures import Future
 from pathlib import Path
 from typing import List, Optional, Sequence, Type, Union, cast
 
-import itertools
 import sys
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -31,12 +31,13 @@ class _TSCatConcatenateTablePM(QtCore.QConcatenateTablesProxyModel):
     def indexes_from_uuid(self, uuid: str) -> List[QtCore.QModelIndex]:
         from .tscat_driver.catalog_model import CatalogModel
 
+        map_from_source = self.mapFromSource
+
         indexes = []
         for model in self.sourceModels():
             assert isinstance(model, CatalogModel)
-            indexes.append(model.index_from_uuid(uuid))
+            indexes.append(map_from_source(model.index_from_uuid(uuid)))
 
-        indexes = list(map(self.mapFromSource, indexes))
         return indexes
 
 
@@ -79,7 +80,11 @@ class TSCatGUI(QtWidgets.QWidget):
         from .tscat_driver.model import tscat_model
         tscat_model.action_done.connect(self._external_signal_emission_changed)
 
-        self.state.state_changed.connect(self.__state_changed)
+        # queued so that rapid state bursts are dispatched through the event-loop,
+        # letting Qt coalesce paint events instead of running the selection work
+        # synchronously inside every state push
+        self.state.state_changed.connect(self.__state_changed,
+                                         QtCore.Qt.ConnectionType.QueuedConnection)
 
     def __state_changed(self, action: str, type: Union[Type[_Catalogue], Type[_Event]],
                         uuids: Sequence[str]) -> None:
@@ -113,8 +118,10 @@ class TSCatGUI(QtWidgets.QWidget):
                     self.__current_event_changed, type=QtCore.Qt.DirectConnection)  # type: ignore
 
             else:
-                indexes = list(itertools.chain(*list(map(self.event_model.indexes_from_uuid, uuids))))
-                indexes = list(map(self.events_sort_model.mapFromSource, indexes))
+                map_from_source = self.events_sort_model.mapFromSource
+                indexes = [map_from_source(index)
+                           for uuid in uuids
+                           for index in self.event_model.indexes_from_uuid(uuid)]
 
                 current_selected_indexes_first_column = set(index for index in self.events_view.selectedIndexes()
                                                             if index.column() == 0)
@@ -163,6 +170,13 @@ class TSCatGUI(QtWidgets.QWidget):
             self.state.updated('active_select', _Event, uuids)
             self.events_selected.emit(uuids)
 
+    def __filter_text_changed(self, text: str) -> None:
+        # pre-compile the pattern once per keystroke and let the regex engine JIT it,
+        # instead of letting the proxy-model recompile it for every item
+        rx = QtCore.QRegularExpression(text, QtCore.QRegularExpression.PatternOption.CaseInsensitiveOption)
+        rx.optimize()
+        self.catalogue_sort_filter_model.setFilterRegularExpression(rx)
+
     def __catalogue_selection_changed(self, _: QtCore.QItemSelection, __: QtCore.QItemSelection) -> None:
         if not self.programmatic_select:
             uuids = [index.data(UUIDDataRole) for index in self.catalogues_view.selectedIndexes()]
@@ -308,8 +322,6 @@ class TSCatGUI(QtWidgets.QWidget):
         self.catalogue_sort_filter_model = _TrashAlwaysTopOrBottomSortFilterModel()
         self.catalogue_sort_filter_model.setSourceModel(self.catalogue_model)
         self.catalogue_sort_filter_model.setRecursiveFilteringEnabled(True)
-        self.catalogue_sort_filter_model.setFilterCaseSensitivity(
-            QtCore.Qt.CaseSensitivity.CaseInsensitive)  # type: ignore
 
         self.catalogues_view.setModel(self.catalogue_sort_filter_model)
         self.catalogues_view.setSortingEnabled(True)
@@ -327,8 +339,7 @@ class TSCatGUI(QtWidgets.QWidget):
         hlayout.addWidget(QtWidgets.QLabel('Filter:'))
 
         catalogue_filter = QtWidgets.QLineEdit()
-        catalogue_filter.textChanged.connect(  # type: ignore
-            lambda t: self.catalogue_sort_filter_model.setFilterRegularExpression(t))
+        catalogue_filter.textChanged.connect(self.__filter_text_changed)  # type: ignore
 
         hlayout.addWidget(catalogue_filter)
 
@@ -467,19 +478,22 @@ class TSCatGUI(QtWidgets.QWidget):
         tscat_model.do(SetAttributeAction(None, [uuid], 'stop', [stop]))
 
     @staticmethod
-    def create_event(start: dt.datetime, stop: dt.datetime, author: str, catalogue_uuid: str) -> _Event:
-        event_loop = QtCore.QEventLoop()
-        entity = None
-
-        def added_event(_: AddEventsToCatalogueAction) -> None:
-            event_loop.quit()
+    def create_event_async(start: dt.datetime, stop: dt.datetime,
+                           author: str, catalogue_uuid: str) -> 'Future[_Event]':
+        # non-blocking variant of create_event: the returned Future is resolved once the
+        # event has been created and added to the catalogue - no nested event-loop needed
+        future: 'Future[_Event]' = Future()
 
         from .tscat_driver.model import tscat_model
 
         def creation_callback(action: CreateEntityAction) -> None:
-            nonlocal entity
             entity = action.entity
-            tscat_model.do(AddEventsToCatalogueAction(added_event, [action.entity.uuid], catalogue_uuid))
+            assert isinstance(entity, _Event)
+
+            def added_event(_: AddEventsToCatalogueAction) -> None:
+                future.set_result(entity)
+
+            tscat_model.do(AddEventsToCatalogueAction(added_event, [entity.uuid], catalogue_uuid))
 
         tscat_model.do(CreateEntityAction(creation_callback, _Event,
                                           {
@@ -488,11 +502,18 @@ class TSCatGUI(QtWidgets.QWidget):
                                               'author': author,
                                           }))
 
-        event_loop.exec()
+        return future
 
-        assert isinstance(entity, _Event)
+    @staticmethod
+    def create_event(start: dt.datetime, stop: dt.datetime, author: str, catalogue_uuid: str) -> _Event:
+        future = TSCatGUI.create_event_async(start, stop, author, catalogue_uuid)
+
+        event_loop = QtCore.QEventLoop()
+        future.add_done_callback(lambda _: event_loop.quit())
+        if not future.done():
+            event_loop.exec()
 
-        return entity
+        return future.result()
 
     @staticmethod
     def move_to_trash(uuid: str) -> None:
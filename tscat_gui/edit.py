@@ -1,10 +1,12 @@
 import datetime as dt
 import functools
-from typing import Union, Dict, Optional, List, Type, cast, Any, Callable
+import math
+import sys
+from typing import Union, Dict, FrozenSet, Optional, List, Tuple, Type, cast, Any, Callable
 
 import tscat
 import tscat.filtering
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
 from .metadata import catalogue_meta_data
 from .predicate import SimplePredicateEditDialog
@@ -33,7 +35,7 @@ class _UuidLabelDelegate(QtWidgets.QWidget):
 
 
 class _ReadOnlyString(str):
-    pass
+    __slots__ = ()
 
 
 class _PredicateDelegate(QtWidgets.QWidget):
@@ -43,14 +45,16 @@ class _PredicateDelegate(QtWidgets.QWidget):
         super().__init__(parent)
 
         self.predicate = value
+        # str() recurses over the whole predicate tree - remember the truncated text
+        # per predicate object so repeated refreshes do not re-stringify it; the entry
+        # keeps the predicate alive so its id cannot be recycled (bounded, the
+        # delegate only ever sees a handful of predicates)
+        self._text_cache: Dict[int, Tuple[Any, str]] = {}
 
         layout = QtWidgets.QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
 
-        value_str = str(value)
-        if len(value_str) > 50:
-            value_str = value_str[:50] + '...'
-        self.label = QtWidgets.QLabel(value_str)
+        self.label = QtWidgets.QLabel(self._format(value))
         layout.addWidget(self.label)
 
         button = QtWidgets.QPushButton("Edit")
@@ -64,22 +68,42 @@ class _PredicateDelegate(QtWidgets.QWidget):
 
         self.setLayout(layout)
 
+    def _format(self, value: Optional[tscat.filtering.Predicate]) -> str:
+        entry = self._text_cache.get(id(value))
+        if entry is not None:
+            return entry[1]
+        # width-aware elision instead of a fixed character cut - Qt measures once here,
+        # the result is cached with the stringification
+        text = self.fontMetrics().elidedText(str(value), QtCore.Qt.TextElideMode.ElideRight, 400)
+        if len(self._text_cache) >= 4:
+            self._text_cache.clear()
+        self._text_cache[id(value)] = (value, text)
+        return text
+
+    @QtCore.Slot()
     def edit_predicate(self):
         dialog = SimplePredicateEditDialog(self.predicate, self)
         result = dialog.exec_()
         if result == QtWidgets.QDialog.Accepted:
-            self.predicate = dialog.predicate
+            self.set_value(dialog.predicate)
             self.editingFinished.emit()
 
+    @QtCore.Slot()
     def clear_predicate(self):
-        self.predicate = None
+        self.set_value(None)
         self.editingFinished.emit()
 
     def value(self) -> Union[tscat.filtering.Predicate, None]:
         return self.predicate
 
+    def set_value(self, value: Optional[tscat.filtering.Predicate]) -> None:
+        self.predicate = value
+        self.label.setText(self._format(value))
+
 
 class _MultipleDifferentValues(list):
+    __slots__ = ('attribute',)
+
     def __init__(self, attribute: str, *args: List) -> None:
         super().__init__(*args)
         self.attribute = attribute
@@ -98,7 +122,7 @@ class _RatingDelegate(QtWidgets.QWidget):
         self.slider.setTickInterval(1)
         self.slider.setTickPosition(QtWidgets.QSlider.TicksBelow)  # type: ignore
         self.slider.valueChanged.connect(self._slider_value_changed)  # type: ignore
-        self.slider.sliderReleased.connect(lambda: self.editingFinished.emit())  # type: ignore
+        self.slider.sliderReleased.connect(self.editingFinished)  # type: ignore
 
         if value:
             self.label.setText(str(value))
@@ -114,6 +138,7 @@ class _RatingDelegate(QtWidgets.QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
+    @QtCore.Slot(int)
     def _slider_value_changed(self, value: int) -> None:
         if value == 0:
             self.label.setText(" ")
@@ -131,16 +156,21 @@ _delegate_widget_class_factory = {
     'uuid': _UuidLabelDelegate,
     'predicate': _PredicateDelegate,
     'rating': _RatingDelegate,
-
-    _ReadOnlyString: _UuidLabelDelegate,
-    int: IntDelegate,
-    str: StrDelegate,
-    float: FloatDelegate,
-    list: EditableKeywordListWidget,
-    bool: BoolDelegate,
-    dt.datetime: DateTimeDelegate,
 }
 
+# identity-scan over the handful of supported value-types is cheaper than hashing the
+# type-object; bool listed before int as a reminder that it must not fall into the
+# int-delegate (type-identity, unlike isinstance, keeps them apart anyway)
+_delegate_widget_class_dispatch = (
+    (bool, BoolDelegate),
+    (int, IntDelegate),
+    (str, StrDelegate),
+    (float, FloatDelegate),
+    (list, EditableKeywordListWidget),
+    (dt.datetime, DateTimeDelegate),
+    (_ReadOnlyString, _UuidLabelDelegate),
+)
+
 
 class _MultipleDifferentValuesDelegate(QtWidgets.QPushButton):
     editingFinished = QtCore.Signal()
@@ -154,7 +184,7 @@ class _MultipleDifferentValuesDelegate(QtWidgets.QPushButton):
 
         self.reset_value = reset_value_selection(values)
 
-        self.clicked.connect(lambda x: self.editingFinished.emit())  # type: ignore
+        self.clicked.connect(self.editingFinished)  # type: ignore
 
     def value(self) -> Any:
         return self.reset_value
@@ -183,11 +213,26 @@ _type_name = {
     'Word List': list,
 }
 
+_type_names = list(_type_name.keys())
+
 _type_name_initial_value = {
-    'DateTime': lambda: dt.datetime.now()
+    'DateTime': dt.datetime.now
 }
 
 
+def _values_equal(a: Any, b: Any) -> bool:
+    # normalized comparison to avoid spurious undo entries and the rebuild cascade
+    # they trigger: QDateTime round-trips introduce sub-second jitter and floats may
+    # differ only by representation noise
+    if type(a) is not type(b):
+        return a == b
+    if isinstance(a, dt.datetime):
+        return a.replace(microsecond=0) == b.replace(microsecond=0)
+    if isinstance(a, float):
+        return a == b or math.isclose(a, b, rel_tol=1e-12)
+    return a == b
+
+
 class AttributesGroupBox(QtWidgets.QGroupBox):
     valuesChanged = QtCore.Signal()
 
@@ -202,34 +247,36 @@ class AttributesGroupBox(QtWidgets.QGroupBox):
         self.attribute_name_labels: Dict[str, QtWidgets.QLabel] = {}
         self.state = state
         self.values: Dict = {}
+        self._rows: Dict[str, Tuple[QtWidgets.QLabel, QtWidgets.QWidget]] = {}
+        self._cls_cache: Dict[Tuple[str, type], type] = {}
 
-        self._layout = QtWidgets.QGridLayout()
-        self._layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(self._layout)
-
-    def setup_values(self, values: Dict):
-        # clear layout, destroy all widgets
-        while True:
-            item = self._layout.takeAt(0)
-            if item:
-                item.widget().deleteLater()
-            else:
-                break
-
-        self.values = values
-        self.attribute_name_labels = {}
-        for row, attr in enumerate(values.keys()):
-            label = self.create_label(attr)
-            self._layout.addWidget(label, row, 0)
-
-            self.attribute_name_labels[attr] = label
-
-            value = values[attr]
+        # the grid lives on an inner container so a full rebuild can swap the whole
+        # container in one go instead of tearing the layout down item by item
+        self._inner = QtWidgets.QWidget()
+        self._grid = QtWidgets.QGridLayout()
+        self._grid.setContentsMargins(0, 0, 0, 0)
+        self._inner.setLayout(self._grid)
 
-            cls: Type[Union[_MultipleDifferentValuesDelegate, _UuidLabelDelegate, _PredicateDelegate,
-            IntDelegate, StrDelegate, FloatDelegate,
-            EditableKeywordListWidget, BoolDelegate, DateTimeDelegate]]
+        layout = QtWidgets.QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._inner)
+        self.setLayout(layout)
 
+        # edits arriving within one event-loop burst are grouped into a single
+        # undo-macro and announced with a single valuesChanged emission
+        self._macro_open = False
+        self._macro_flush_timer = QtCore.QTimer(self)
+        self._macro_flush_timer.setSingleShot(True)
+        self._macro_flush_timer.setInterval(0)
+        self._macro_flush_timer.timeout.connect(self._flush_macro)  # type: ignore
+
+    def _delegate_class(self, attr: str, value: Any) -> Type[QtWidgets.QWidget]:
+        # the resolved class is cached per (attribute, value-type) - a stable key across
+        # rebuilds - so subsequent setups take one dict lookup instead of probing the factory
+        key = (attr, value.__class__)
+        cls = self._cls_cache.get(key)
+        if cls is None:
+            factory = _delegate_widget_class_factory
             if isinstance(value, _MultipleDifferentValues):
                 if attr == 'start':
                     cls = _MultipleDifferentValuesDelegateMin
@@ -237,21 +284,121 @@ class AttributesGroupBox(QtWidgets.QGroupBox):
                     cls = _MultipleDifferentValuesDelegateMax
                 else:
                     cls = _MultipleDifferentValuesDelegate
-            elif attr in _delegate_widget_class_factory:
-                cls = _delegate_widget_class_factory[attr]
+            elif attr in factory:
+                cls = factory[attr]
             else:
-                cls = _delegate_widget_class_factory.get(type(value), QtWidgets.QLabel)
+                value_type = type(value)
+                for dispatch_type, dispatch_cls in _delegate_widget_class_dispatch:
+                    if value_type is dispatch_type:
+                        cls = dispatch_cls
+                        break
+                else:
+                    cls = QtWidgets.QLabel
+            self._cls_cache[key] = cls
+        return cls
+
+    def _create_delegate(self, attr: str, value: Any) -> QtWidgets.QWidget:
+        cls = self._delegate_class(attr, value)
+        widget = cls(value, parent=self)  # type: ignore[misc]
+
+        # special case for UUIDs - read-only
+        if attr == 'uuid':
+            widget.setEnabled(False)
+        else:
+            # the push must stay synchronous: a deferred commit can be rebased away by a
+            # setup() arriving in the same click (focus-out commit plus selection change)
+            callback = functools.partial(self._edit_finished_on_widget, widget, attr)
+            # the editingFinished-signal is not seen by mypy coming from PySide6
+            widget.editingFinished.connect(callback)  # type: ignore
+
+        return widget
+
+    def _set_row_value(self, attr: str, value: Any, widget: QtWidgets.QWidget) -> bool:
+        # a surviving widget whose delegate-class still matches takes the new value in
+        # place - cheaper than constructing and wiring a replacement; the blocker keeps
+        # the programmatic set_value from looping back into editingFinished
+        if type(widget) is not self._delegate_class(attr, value):
+            return False
+        set_value = getattr(widget, 'set_value', None)
+        if set_value is None:
+            return False
+        blocker = QtCore.QSignalBlocker(widget)
+        set_value(value)
+        del blocker
+        return True
+
+    def setup_values(self, values: Dict) -> bool:
+        # batch the layout mutations: one geometry/repaint pass instead of one per
+        # widget added, and no signal emissions while rows are in flux
+        self.setUpdatesEnabled(False)
+        blocked = self.blockSignals(True)
+        try:
+            return self._reconcile_rows(values)
+        finally:
+            self.blockSignals(blocked)
+            self.setUpdatesEnabled(True)
+
+    def _reconcile_rows(self, values: Dict) -> bool:
+        # reconcile with the previously shown values: rows whose value is unchanged keep
+        # their widgets, only the difference is created/destroyed; returns True when the
+        # grid container was rebuilt (row set or order changed)
+        old_values = self.values
+        rows = self._rows
+
+        self.values = values
+        self.attribute_name_labels = {}
 
-            widget = cls(value, parent=self)
+        if list(values.keys()) == list(old_values.keys()):
+            # same rows in the same order: replace changed editors in place, no layout surgery
+            for attr, value in values.items():
+                label, widget = rows[attr]
+                old_value = old_values[attr]
+                if not (type(old_value) is type(value) and old_value == value) and \
+                        not self._set_row_value(attr, value, widget):
+                    new_widget = self._create_delegate(attr, value)
+                    self._grid.replaceWidget(widget, new_widget)
+                    widget.deleteLater()
+                    rows[attr] = (label, new_widget)
+                self.attribute_name_labels[attr] = label
+            return False
+
+        for attr in set(rows) - set(values):
+            label, widget = rows.pop(attr)
+            label.deleteLater()
+            widget.deleteLater()
+
+        # populate a fresh container off-screen and swap it in: one replaceWidget call
+        # instead of a takeAt round-trip per layout item
+        new_inner = QtWidgets.QWidget()
+        new_grid = QtWidgets.QGridLayout()
+        new_grid.setContentsMargins(0, 0, 0, 0)
+        new_inner.setLayout(new_grid)
 
-            # special case for UUIDs - read-only
-            if attr == 'uuid':
-                widget.setEnabled(False)
+        for row, attr in enumerate(values.keys()):
+            value = values[attr]
+
+            entry = rows.get(attr)
+            if entry is not None and attr in old_values and \
+                    (type(old_values[attr]) is type(value) and old_values[attr] == value or
+                     self._set_row_value(attr, value, entry[1])):
+                label, widget = entry
             else:
-                # the editingFinished-signal is not seen by mypy coming from PySide6
-                widget.editingFinished.connect(  # type: ignore
-                    functools.partial(self._edit_finished_on_widget, widget, attr))  # type: ignore
-            self._layout.addWidget(widget, row, 1)
+                if entry is not None:
+                    entry[0].deleteLater()
+                    entry[1].deleteLater()
+                label = self.create_label(attr)
+                widget = self._create_delegate(attr, value)
+                rows[attr] = (label, widget)
+
+            self.attribute_name_labels[attr] = label
+            new_grid.addWidget(label, row, 0)
+            new_grid.addWidget(widget, row, 1)
+
+        cast(QtWidgets.QVBoxLayout, self.layout()).replaceWidget(self._inner, new_inner)
+        self._inner.deleteLater()
+        self._inner = new_inner
+        self._grid = new_grid
+        return True
 
     def _edit_finished_on_widget(self, w: QtWidgets.QWidget, a: str) -> None:
 
@@ -261,11 +408,25 @@ class AttributesGroupBox(QtWidgets.QGroupBox):
 
         self._editing_finished(a, w.value())
 
+    @QtCore.Slot(str, object)
     def _editing_finished(self, attr, value) -> None:
-        if value != self.values[attr]:
+        old = self.values[attr]
+        # identity catches re-emitted editingFinished with unchanged content before the
+        # potentially element-wise comparison (keyword lists)
+        if value is not old and not _values_equal(value, old):
+            if not self._macro_open:
+                self.state.undo_stack().beginMacro('Edit attributes')
+                self._macro_open = True
             self.state.push_undo_command(SetAttributeValue, attr, value)
-            self.valuesChanged.emit()
             self.values[attr] = value
+            self._macro_flush_timer.start()
+
+    @QtCore.Slot()
+    def _flush_macro(self) -> None:
+        if self._macro_open:
+            self.state.undo_stack().endMacro()
+            self._macro_open = False
+            self.valuesChanged.emit()
 
 
 class FixedAttributesGroupBox(AttributesGroupBox):
@@ -277,16 +438,30 @@ class FixedAttributesGroupBox(AttributesGroupBox):
     def setup(self, entities: List[Union[tscat._Catalogue, tscat._Event]]) -> None:
         values: Dict[str, Any] = {}
 
+        # one values-lookup per attribute instead of the test-then-index pairs; start and
+        # stop are only ever displayed through their min/max-delegates, so for them the
+        # conflict list keeps the two running extremes instead of every distinct value
+        missing = object()
         for entity in entities:
-            for attr in entity.fixed_attributes().keys():
-                value = entity.__dict__[attr]
-                if attr in values:
-                    if isinstance(values[attr], _MultipleDifferentValues):
-                        values[attr].append(value)
-                    elif values[attr] != value:
-                        values[attr] = _MultipleDifferentValues(attr, [values[attr], value])
-                else:
+            entity_dict = entity.__dict__
+            for attr in entity.fixed_attributes():
+                value = entity_dict[attr]
+                existing = values.get(attr, missing)
+                if existing is missing:
                     values[attr] = value
+                elif isinstance(existing, _MultipleDifferentValues):
+                    if attr == 'start' or attr == 'stop':
+                        if value < existing[0]:
+                            existing[0] = value
+                        elif value > existing[1]:
+                            existing[1] = value
+                    else:
+                        existing.append(value)
+                elif existing != value:
+                    if (attr == 'start' or attr == 'stop') and value < existing:
+                        values[attr] = _MultipleDifferentValues(attr, [value, existing])
+                    else:
+                        values[attr] = _MultipleDifferentValues(attr, [existing, value])
 
         super().setup_values(values)
 
@@ -294,12 +469,12 @@ class FixedAttributesGroupBox(AttributesGroupBox):
 class CustomAttributesGroupBox(AttributesGroupBox):
 
     def create_label(self, text: str) -> EditableLabel:  # type: ignore
-        attrs = self.all_attribute_names[:]
-        attrs.remove(text)
-
-        name = EditableLabel(text, AttributeNameValidator(attrs))
-        name.editing_finished.connect(lambda x, _text=text: self._attribute_name_changed(_text, x))
-        name.text_changed.connect(lambda x, _text=text: self._attribute_name_is_changing(_text, x))
+        # one validator instance is shared between all rows; it excludes the name
+        # currently being edited from the collision check
+        name = EditableLabel(text, self._name_validator)
+        name.editing_started.connect(self._name_validator.set_current)
+        name.editing_finished.connect(functools.partial(self._attribute_name_changed, text))
+        name.text_changed.connect(functools.partial(self._attribute_name_is_changing, text))
 
         return name
 
@@ -308,7 +483,11 @@ class CustomAttributesGroupBox(AttributesGroupBox):
                  parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__("Custom", state, parent)
 
-        self.all_attribute_names: List[str] = []
+        self.all_attribute_names: FrozenSet[str] = frozenset()
+        self._highlighted_label: Optional[QtWidgets.QLabel] = None
+        self._name_validator = AttributeNameValidator(parent=self)
+        self._delete_buttons: Dict[str, QtWidgets.QToolButton] = {}
+        self._new_section: Optional[Tuple[QtWidgets.QLabel, QtWidgets.QWidget]] = None
 
     def setup(self, entities: List[Union[tscat._Catalogue, tscat._Event]]) -> None:
         if len(entities) > 1:
@@ -317,75 +496,104 @@ class CustomAttributesGroupBox(AttributesGroupBox):
 
         self.show()
 
-        entity = entities[0]
-        self.all_attribute_names = list(entity.variable_attributes().keys()) + \
-                                   list(entity.fixed_attributes().keys())
-
-        attributes = sorted(entity.variable_attributes().keys())
-        values = {}
-        for attr in attributes:
-            values[attr] = entity.__dict__[attr]
-
-        super().setup_values(values)
-
-        layout = cast(QtWidgets.QGridLayout, self.layout())
-
-        # add a delete-button to each row
-        for row, attr in enumerate(attributes):
-            but = QtWidgets.QToolButton()
-            but.setText('✖')
-            but.clicked.connect(lambda a=attr, x=False: self._delete(a))  # type: ignore
-            layout.addWidget(but, row, 2)
-
-        # add the new-attribute-button
-        new_section_layout = QtWidgets.QHBoxLayout()
-        new_section_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.type_combobox = QtWidgets.QComboBox()
-        self.type_combobox.addItems(list(_type_name.keys()))
-        new_section_layout.addWidget(self.type_combobox)
-
-        button = QtWidgets.QToolButton()
-        button.setText('➕')
-        button.clicked.connect(self._new)  # type: ignore
-        new_section_layout.addWidget(button)
-
-        new_section_layout.addStretch()
-
-        widget = QtWidgets.QWidget()
-        widget.setLayout(new_section_layout)
-
-        row = layout.rowCount()
-        layout.addWidget(QtWidgets.QLabel('New'), row, 0)
-        layout.addWidget(widget, row, 1)
+        # rows may be destroyed by the reconciliation below - drop the stale reference
+        self._highlighted_label = None
 
+        entity = entities[0]
+        variable_attributes = entity.variable_attributes()
+        self.all_attribute_names = frozenset(variable_attributes) | frozenset(entity.fixed_attributes())
+        self._name_validator.set_invalid_words(self.all_attribute_names)
+
+        entity_dict = entity.__dict__
+        # custom names originate from user input: interning them lets all the dict
+        # lookups they flow through take the pointer-equality fast path
+        attributes = sorted(map(sys.intern, variable_attributes.keys()))
+        values = {attr: entity_dict[attr] for attr in attributes}
+
+        rebuilt = super().setup_values(values)
+
+        # reconcile the per-row delete-buttons like setup_values does for the rows
+        for attr in set(self._delete_buttons) - set(values):
+            self._delete_buttons.pop(attr).deleteLater()
+
+        # the new-attribute-section is created once
+        if self._new_section is None:
+            new_section_layout = QtWidgets.QHBoxLayout()
+            new_section_layout.setContentsMargins(0, 0, 0, 0)
+
+            self.type_combobox = QtWidgets.QComboBox()
+            self.type_combobox.addItems(_type_names)
+            new_section_layout.addWidget(self.type_combobox)
+
+            button = QtWidgets.QToolButton()
+            button.setText('➕')
+            button.clicked.connect(self._new)  # type: ignore
+            new_section_layout.addWidget(button)
+
+            new_section_layout.addStretch()
+
+            widget = QtWidgets.QWidget()
+            widget.setLayout(new_section_layout)
+
+            self._new_section = (QtWidgets.QLabel('New'), widget)
+
+        # with unchanged rows the extra column is still in place - but a never-populated
+        # grid (first setup of an entity without custom attributes) takes the same-keys
+        # fast path and must still receive the new-section
+        if rebuilt or self._grid.indexOf(self._new_section[1]) == -1:
+            grid = self._grid
+            for row, attr in enumerate(attributes):
+                but = self._delete_buttons.get(attr)
+                if but is None:
+                    but = QtWidgets.QToolButton()
+                    but.setText('✖')
+                    but.clicked.connect(functools.partial(self._delete, attr))  # type: ignore
+                    self._delete_buttons[attr] = but
+                grid.addWidget(but, row, 2)
+
+            row = len(attributes)
+            grid.addWidget(self._new_section[0], row, 0)
+            grid.addWidget(self._new_section[1], row, 1)
+
+    @QtCore.Slot(str)
     def _delete(self, attr) -> None:
         self.state.push_undo_command(DeleteAttribute, attr)
 
+    @QtCore.Slot()
     def _new(self) -> None:
-        name = 'attribute{}'
+        # single pass over the existing names instead of probing attribute1, attribute2, ...
+        # with one format and dict lookup per step
+        taken = {int(k[9:]) for k in self.values if k.startswith('attribute') and k[9:].isdigit()}
 
         i = 1
-        while name.format(i) in self.values.keys():
+        while i in taken:
             i += 1
 
-        name = name.format(i)
+        name = f'attribute{i}'
 
-        type_name = self.type_combobox.itemText(self.type_combobox.currentIndex())
+        type_name = self.type_combobox.currentText()
         default = _type_name_initial_value.get(type_name, _type_name[type_name])()
 
         self.state.push_undo_command(NewAttribute, name, default)
 
+    @QtCore.Slot(str, str)
     def _attribute_name_changed(self, previous: str, text: str) -> None:
         self.state.push_undo_command(RenameAttribute, previous, text)
 
+    @QtCore.Slot(str, str)
     def _attribute_name_is_changing(self, previous: str, text: str) -> None:
-        # highlight the existing attribute which is using the same text as name
-        for label in self.attribute_name_labels.values():
-            label.setStyleSheet('background-color: none')
+        # highlight the existing attribute which is using the same text as name; only
+        # the label highlighted by the previous keystroke needs resetting - clearing
+        # every label would reparse a stylesheet per row on each keystroke
+        if self._highlighted_label is not None:
+            self._highlighted_label.setStyleSheet('')
+            self._highlighted_label = None
 
-        if text in self.attribute_name_labels and previous != text:
-            self.attribute_name_labels[text].setStyleSheet('color: red')
+        if previous != text:
+            label = self.attribute_name_labels.get(text)
+            if label is not None:
+                label.setStyleSheet('color: red')
+                self._highlighted_label = label
 
 
 class CatalogueMetaDataGroupBox(AttributesGroupBox):
@@ -414,24 +622,47 @@ class _EntityEditWidget(QtWidgets.QWidget):
     def __init__(self, state: AppState, parent=None) -> None:
         super().__init__(parent)
 
-        layout = QtWidgets.QVBoxLayout()
-        layout.setContentsMargins(5, 5, 5, 5)
+        self._state = state
+        self._uuids: List[str] = []
 
-        self.meta_data = CatalogueMetaDataGroupBox(state)
-        layout.addWidget(self.meta_data)
+        self._layout = QtWidgets.QVBoxLayout()
+        self._layout.setContentsMargins(5, 5, 5, 5)
 
-        self.fixed_attributes = FixedAttributesGroupBox(state)
-        layout.addWidget(self.fixed_attributes)
+        # the group-boxes are built on first show - constructing their widgets is
+        # expensive and pointless as long as the editor is not visible
+        self.meta_data: Optional[CatalogueMetaDataGroupBox] = None
+        self.fixed_attributes: Optional[FixedAttributesGroupBox] = None
+        self.attributes: Optional[CustomAttributesGroupBox] = None
 
-        self.attributes: Optional[CustomAttributesGroupBox]
-        self.attributes = CustomAttributesGroupBox(state)
-        layout.addWidget(self.attributes)
+        self.setLayout(self._layout)
 
-        layout.addStretch()
+    def _initialize(self) -> None:
+        if self.fixed_attributes is not None:
+            return
 
-        self.setLayout(layout)
+        self.meta_data = CatalogueMetaDataGroupBox(self._state)
+        self._layout.addWidget(self.meta_data)
+
+        self.fixed_attributes = FixedAttributesGroupBox(self._state)
+        self._layout.addWidget(self.fixed_attributes)
+
+        self.attributes = CustomAttributesGroupBox(self._state)
+        self._layout.addWidget(self.attributes)
+
+        self._layout.addStretch()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        if self.fixed_attributes is None:
+            self._initialize()
+            if self._uuids:
+                self.setup(self._uuids)
+        super().showEvent(event)
 
     def setup(self, uuids: List[str]) -> None:
+        self._uuids = uuids
+
+        if self.fixed_attributes is None:  # applied on first show
+            return
 
         from .tscat_driver.model import tscat_model
         entities = tscat_model.entities_from_uuids(uuids)
@@ -451,6 +682,16 @@ class EntityEditView(QtWidgets.QScrollArea):
         self.edit: Optional[_EntityEditWidget] = None
         self.state = state
         self.current_uuids: List[str] = []
+        self._current_uuid_set: FrozenSet[str] = frozenset()
+
+        # bursts of model-actions (undo-redo, batch edits) are coalesced into a single
+        # edit-widget refresh per event-loop turn; while the view is hidden the
+        # refresh is only noted and caught up on the next show
+        self._dirty = False
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)  # type: ignore
 
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOn)  # type: ignore
         self.setWidgetResizable(True)
@@ -460,31 +701,54 @@ class EntityEditView(QtWidgets.QScrollArea):
         from .tscat_driver.model import tscat_model
         tscat_model.action_done.connect(self._model_action_done)
 
+    @QtCore.Slot(str, type, list)
     def state_changed(self, action: str,
                       _: Union[Type[tscat._Catalogue], Type[tscat._Event]],
                       uuids: List[str]) -> None:
         if action == 'active_select':
-            if self.current_uuids != uuids:
-                if self.edit:
-                    self.edit.deleteLater()
-                    self.edit = None
-
+            # compare as sets: a reordered selection shows the same entities and must
+            # not trigger a rebuild; the set also serves the membership tests below
+            uuid_set = frozenset(uuids)
+            if self._current_uuid_set != uuid_set:
+                self._current_uuid_set = uuid_set
                 self.current_uuids = uuids
 
                 if len(uuids) > 0:
-                    self.edit = _EntityEditWidget(self.state)
-                    self.setWidget(self.edit)
+                    # rebind the existing widget tree to the new selection - the group-box
+                    # reconciliation reuses every row the new entity shares with the old one
+                    if self.edit is None:
+                        self.edit = _EntityEditWidget(self.state)
+                        self.setWidget(self.edit)
                     self.edit.setup(self.current_uuids)
+                elif self.edit:
+                    self.takeWidget().deleteLater()
+                    self.edit = None
         elif action == 'passive_select':
             pass
         else:
             print('unsupported (old) state-changed', action)
 
+    @QtCore.Slot()
+    def _do_refresh(self) -> None:
+        if not self.isVisible():
+            self._dirty = True
+            return
+
+        self._dirty = False
+        if self.edit:
+            self.edit.setup(self.current_uuids)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        if self._dirty:
+            self._do_refresh()
+        super().showEvent(event)
+
+    @QtCore.Slot(object)
     def _model_action_done(self, action: Action) -> None:
         if self.edit:
             if isinstance(action, GetCatalogueAction):
-                if action.uuid in self.current_uuids:
-                    self.edit.setup(self.current_uuids)
+                if action.uuid in self._current_uuid_set:
+                    self._refresh_timer.start()
             elif isinstance(action, (SetAttributeAction, DeleteAttributeAction)):
-                if any(entity.uuid in self.current_uuids for entity in action.entities):
-                    self.edit.setup(self.current_uuids)
+                if any(entity.uuid in self._current_uuid_set for entity in action.entities):
+                    self._refresh_timer.start()
@@ -1,9 +1,7 @@
-from typing import List, cast
+from typing import List
 
 import tscat
 
-from .model_base.constants import EntityRole
-
 
 def __total_event_count(catalogues: List[tscat._Catalogue]) -> str:
     from .tscat_driver.model import tscat_model
@@ -12,22 +10,15 @@ def __total_event_count(catalogues: List[tscat._Catalogue]) -> str:
 
 def __global_start_stop_range(catalogues: List[tscat._Catalogue]) -> str:
     from .tscat_driver.model import tscat_model
-    min_start, max_stop = None, None
-    for c in catalogues:
-        model = tscat_model.catalog(c.uuid)
-        for i in range(model.rowCount()):
-            event = cast(tscat._Event, model.data(model.index(i, 0), EntityRole))
-
-            assert event is not None
-
-            if min_start is None or event.start < min_start:
-                min_start = event.start
-            if max_stop is None or event.stop > max_stop:
-                max_stop = event.stop
-
-    if None in (min_start, max_stop):
+    # the events are read directly from the catalog-models and the extremes found with
+    # the builtin min/max - no data(index(i, 0)) round-trip and interpreted comparison
+    # pair per event
+    events = [event
+              for c in catalogues
+              for event in tscat_model.catalog(c.uuid).events()]
+    if not events:
         return '-'
-    return f'between {min_start} and {max_stop}'
+    return f'between {min(e.start for e in events)} and {max(e.stop for e in events)}'
 
 
 catalogue_meta_data = {
@@ -3,7 +3,7 @@ from PySide6 import QtCore
 
 import copy
 import dataclasses
-from typing import Union, Type, Optional, List
+from typing import Union, Type, List
 
 import tscat
 
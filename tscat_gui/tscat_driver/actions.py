@@ -3,7 +3,6 @@ import os
 from dataclasses import dataclass, field
 from typing import Any, Callable, List, Optional, Sequence, Type, Union
 
-from sqlalchemy_utils import table_name
 from tscat import EventQueryInformation, _Catalogue, _Event, add_events_to_catalogue, canonicalize_json_import, \
     create_catalogue, create_event, export_json, export_votable, canonicalize_votable_import, get_catalogues, \
     get_events, \
@@ -1,5 +1,5 @@
 import pickle
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
 
 from PySide6.QtCore import QAbstractTableModel, QMimeData, QModelIndex, QPersistentModelIndex, Qt
 from PySide6.QtGui import QColor
@@ -13,16 +13,30 @@ from .nodes import CatalogNode, EventNode, TrashNode
 from ..model_base.constants import EntityRole, UUIDDataRole
 
 
+# hoisted out of the per-paint data()/headerData() calls - Qt queries them for
+# every visible cell while scrolling
+_display_role = Qt.DisplayRole  # type: ignore
+_background_role = Qt.BackgroundRole  # type: ignore
+_light_gray = QColor(Qt.lightGray)  # type: ignore
+
+
 class CatalogModel(QAbstractTableModel):
-    _columns = ['start', 'stop', 'author', 'tags', 'products', 'rating']
+    _columns = ('start', 'stop', 'author', 'tags', 'products', 'rating')
+    _column_titles = tuple(c.title() for c in _columns) + ('Attributes',)
 
     def __init__(self, root: CatalogNode):
         super().__init__()
         self._root = root
         self._trash = TrashNode()
+        # uuid-to-row map and per-node display strings built lazily, dropped on any
+        # mutation - views re-query data() for every visible cell while scrolling
+        self._uuid_rows: Optional[Dict[str, int]] = None
+        self._display_cache: Dict[EventNode, List[str]] = {}
         tscat_driver.action_done_prioritised.connect(self._driver_action_done, Qt.QueuedConnection)
 
     def _driver_action_done(self, action: Action) -> None:
+        self._uuid_rows = None
+        self._display_cache.clear()
         if isinstance(action, GetCatalogueAction):
             if action.uuid == self._root.uuid:
                 children = [EventNode(e, i.assigned) for e, i in zip(action.events, action.query_info)]
@@ -30,9 +44,17 @@ class CatalogModel(QAbstractTableModel):
                     # unused for now
                     self._trash.set_children(children)
                 else:
-                    self.beginResetModel()
-                    self._root.set_children(children)
-                    self.endResetModel()
+                    # a refresh returning the same rows (e.g. after attribute edits) only
+                    # updates data - a model reset would drop selection and scroll position
+                    old_uuids = [c.uuid for c in self._root.children]
+                    if old_uuids and old_uuids == [c.uuid for c in children]:
+                        self._root.set_children(children)
+                        self.dataChanged.emit(self.index(0, 0),
+                                              self.index(len(old_uuids) - 1, self.columnCount() - 1))  # type: ignore
+                    else:
+                        self.beginResetModel()
+                        self._root.set_children(children)
+                        self.endResetModel()
 
         elif isinstance(action, (SetAttributeAction, DeleteAttributeAction)):
             for e in filter(lambda x: isinstance(x, _Event), action.entities):
@@ -131,11 +153,9 @@ class CatalogModel(QAbstractTableModel):
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: int = Qt.DisplayRole) -> Any:  # type: ignore
         if orientation == Qt.Orientation.Horizontal:
-            if role == Qt.DisplayRole:  # type: ignore
-                if section < len(self._columns):
-                    return self._columns[section].title()
-                else:
-                    return "Attributes"
+            if role == _display_role:
+                if section < len(self._column_titles):
+                    return self._column_titles[section]
         return None
 
     def columnCount(self, parent: Optional[Union[QModelIndex, QPersistentModelIndex]] = None) -> int:
@@ -159,15 +179,18 @@ class CatalogModel(QAbstractTableModel):
         child = self._root.children[index.row()]
         assert isinstance(child, EventNode)
 
-        if role == Qt.DisplayRole:  # type: ignore
-            if index.column() < len(self._columns):
-                key = self._columns[index.column()]
-                return str(child.node.__dict__[key])
-            else:
-                return str(child.node.variable_attributes())
-        elif role == Qt.BackgroundRole:  # type: ignore
+        if role == _display_role:
+            texts = self._display_cache.get(child)
+            if texts is None:
+                node = child.node
+                node_dict = node.__dict__
+                texts = [str(node_dict[key]) for key in self._columns]
+                texts.append(str(node.variable_attributes()))
+                self._display_cache[child] = texts
+            return texts[index.column()]
+        elif role == _background_role:
             if not child.is_assigned():
-                return QColor(Qt.lightGray)  # type: ignore
+                return _light_gray
         elif role == UUIDDataRole:
             return child.uuid
         elif role == EntityRole:
@@ -175,11 +198,18 @@ class CatalogModel(QAbstractTableModel):
 
         return None
 
+    def events(self) -> List[_Event]:
+        # direct access for aggregations - avoids a data(index(i, 0)) round-trip per row
+        return [cast(EventNode, child).node for child in self._root.children]
+
     def index_from_uuid(self, uuid: str, parent=QModelIndex()) -> QModelIndex:
-        for row, event in enumerate(self._root.children):
-            if event.uuid == uuid:
-                return self.index(row, 0)
-        return QModelIndex()
+        rows = self._uuid_rows
+        if rows is None:
+            rows = self._uuid_rows = {child.uuid: row for row, child in enumerate(self._root.children)}
+        row = rows.get(uuid)
+        if row is None:
+            return QModelIndex()
+        return self.index(row, 0)
 
     def mimeTypes(self) -> List[str]:
         return super().mimeTypes() + ['application/x-tscat-event-uuid-list']
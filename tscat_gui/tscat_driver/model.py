@@ -1,9 +1,10 @@
 from typing import Union, Sequence, List
 
-from PySide6.QtCore import QObject, QAbstractItemModel, Signal, Qt
+from PySide6.QtCore import QObject, Signal, Qt
 from tscat import _Event, _Catalogue
 
 from .actions import Action
+from .catalog_model import CatalogModel
 from .tscat_root_model import TscatRootModel
 
 
@@ -23,7 +24,7 @@ class _Model(QObject):
         if action.user_callback:
             action.user_callback(action)
 
-    def catalog(self, uid: str) -> QAbstractItemModel:
+    def catalog(self, uid: str) -> CatalogModel:
         return self._tscat_root.catalog(uid)
 
     def tscat_root(self) -> TscatRootModel:
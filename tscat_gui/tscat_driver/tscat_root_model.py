@@ -3,7 +3,7 @@ import itertools
 import os
 import pickle
 import tempfile
-from typing import Dict, Any, Union, cast, List, Sequence
+from typing import Dict, Any, Optional, Tuple, Union, cast, List, Sequence
 
 from PySide6.QtCore import QModelIndex, QAbstractItemModel, QPersistentModelIndex, Qt, QMimeData, Signal, QUrl
 from tscat import _Catalogue
@@ -18,6 +18,10 @@ from ..model_base.constants import UUIDDataRole, EntityRole
 from ..utils.import_export import export_to_json
 
 
+# hoisted out of the per-paint data() calls
+_display_role = Qt.ItemDataRole.DisplayRole
+
+
 class TscatRootModel(QAbstractItemModel):
     events_dropped_on_catalogue = Signal(str, list)
 
@@ -29,16 +33,27 @@ class TscatRootModel(QAbstractItemModel):
         self._root.append_child(self._trash)
 
         self._catalogues: Dict[str, CatalogModel] = {}
+        # uuid-to-node map built lazily for index_from_uuid, dropped on any mutation
+        self._uuid_nodes: Optional[Dict[str, CatalogNode]] = None
+
+        # the trashed catalogues are only queried when the trash node is first
+        # expanded - see canFetchMore/fetchMore
+        self._trash_loaded = False
+
+        # last drag-export, keyed by the dragged uuids - Qt may re-query mimeData
+        # during one drag and users often repeat the same drag
+        self._mime_url_cache: Optional[Tuple[Tuple[str, ...], List[QUrl]]] = None
 
         tscat_driver.action_done_prioritised.connect(self._driver_action_done, Qt.QueuedConnection)
 
         tscat_driver.do(GetCataloguesAction(None, False))
-        tscat_driver.do(GetCataloguesAction(None, True))
 
     def _trash_index(self) -> QModelIndex:
         return self.index(0, 0, QModelIndex())
 
     def _driver_action_done(self, action: Action) -> None:
+        self._uuid_nodes = None
+        self._mime_url_cache = None
         if isinstance(action, GetCataloguesAction):
             if action.removed_items:
                 self.beginRemoveRows(self._trash_index(), 0, len(self._trash.children) - 1)
@@ -49,10 +64,19 @@ class TscatRootModel(QAbstractItemModel):
                 self._trash.set_children(list(map(CatalogNode, action.catalogues)))
                 self.endInsertRows()
             else:
-                self.beginResetModel()
-                self._root.set_children([self._trash])
-                self._root.append_children(list(map(CatalogNode, action.catalogues)))
-                self.endResetModel()
+                # same catalogue set in the same order: swap the entities and emit
+                # dataChanged per row instead of resetting the whole tree
+                children = self._root.children
+                if [c.uuid for c in children[1:]] == [c.uuid for c in action.catalogues]:
+                    for row, entity in enumerate(action.catalogues, start=1):
+                        cast(CatalogNode, children[row]).node = entity
+                        index = self.index(row, 0, QModelIndex())
+                        self.dataChanged.emit(index, index)  # type: ignore
+                else:
+                    self.beginResetModel()
+                    self._root.set_children([self._trash])
+                    self._root.append_children(list(map(CatalogNode, action.catalogues)))
+                    self.endResetModel()
 
         elif isinstance(action, GetCatalogueAction):
             for row, child in enumerate(self._root.children):
@@ -161,15 +185,19 @@ class TscatRootModel(QAbstractItemModel):
         return self._catalogues[uuid]
 
     def index_from_uuid(self, uuid: str, parent=QModelIndex()) -> QModelIndex:
-        for i in range(self.rowCount(parent)):
-            index = self.index(i, 0, parent)
-            if self.data(index, UUIDDataRole) == uuid:
-                return index
-            if self.rowCount(index) > 0:
-                result = self.index_from_uuid(uuid, index)
-                if result != QModelIndex():
-                    return result
-        return QModelIndex()
+        # served from a lazily built uuid-to-node map instead of a recursive walk
+        # issuing rowCount/index/data calls per node per lookup
+        nodes = self._uuid_nodes
+        if nodes is None:
+            nodes = self._uuid_nodes = {
+                child.uuid: child
+                for child in itertools.chain(self._root.children, self._trash.children)
+                if isinstance(child, CatalogNode)
+            }
+        node = nodes.get(uuid)
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
 
     def index(self, row: int, column: int,
               parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()) -> QModelIndex:
@@ -212,17 +240,34 @@ class TscatRootModel(QAbstractItemModel):
     def columnCount(self, parent: Union[QModelIndex, QPersistentModelIndex] = None) -> int:  # type: ignore
         return 1
 
+    def hasChildren(self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()) -> bool:
+        # the trash shows an expander before its deferred query has run
+        if parent.isValid() and parent.internalPointer() is self._trash and not self._trash_loaded:
+            return True
+        return super().hasChildren(parent)
+
+    def canFetchMore(self, parent: Union[QModelIndex, QPersistentModelIndex]) -> bool:
+        if parent.isValid() and parent.internalPointer() is self._trash:
+            return not self._trash_loaded
+        return False
+
+    def fetchMore(self, parent: Union[QModelIndex, QPersistentModelIndex]) -> None:
+        if parent.isValid() and parent.internalPointer() is self._trash and not self._trash_loaded:
+            self._trash_loaded = True
+            tscat_driver.do(GetCataloguesAction(None, True))
+
     def data(self, index: Union[QModelIndex, QPersistentModelIndex],
              role: Qt.ItemDataRole = Qt.DisplayRole) -> Any:  # type: ignore
         if index.isValid():
             item = cast(NamedNode, index.internalPointer())
-            if role == Qt.ItemDataRole.DisplayRole:
+            if role == _display_role:
                 return item.name
+            # CatalogNode is a leaf class - the exact-type check skips the MRO walk
             elif role == UUIDDataRole:
-                if isinstance(item, CatalogNode):
+                if type(item) is CatalogNode:
                     return item.uuid
             elif role == EntityRole:
-                if isinstance(item, CatalogNode):
+                if type(item) is CatalogNode:
                     return item.node
 
     def flags(self, index: Union[QModelIndex, QPersistentModelIndex]) -> Qt.ItemFlag:
@@ -267,25 +312,29 @@ class TscatRootModel(QAbstractItemModel):
     def mimeData(self, indexes: Sequence[QModelIndex]) -> QMimeData:
         mime_data = super().mimeData(indexes)
 
+        catalogues = [self.data(index, EntityRole) for index in indexes]
+        key = tuple(c.uuid for c in catalogues)
+
+        if self._mime_url_cache is not None and self._mime_url_cache[0] == key:
+            mime_data.setUrls(self._mime_url_cache[1])
+            return mime_data
+
         urls: List[QUrl] = []
-        for index in indexes:
+        for catalogue in catalogues:
             now = dt.datetime.now().isoformat()
-            catalogue = self.data(index, EntityRole)
 
             path = os.path.join(tempfile.gettempdir(), 'tscat_gui', f'{catalogue.name}-{now}-export.json')
             os.makedirs(os.path.dirname(path), exist_ok=True)
 
-            print('exporting', catalogue, path)
             result = export_to_json(path, [catalogue.uuid])
 
             if result is None:
                 path_url = QUrl.fromLocalFile(path)
                 urls.append(path_url)
 
+        self._mime_url_cache = (key, urls)
         mime_data.setUrls(urls)
 
-        print('dragging')
-
         return mime_data
 
     def catalogue_nodes(self, in_trash: bool) -> Sequence[CatalogNode]:
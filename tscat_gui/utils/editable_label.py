@@ -4,6 +4,7 @@ from PySide6 import QtCore, QtWidgets, QtGui
 
 
 class EditableLabel(QtWidgets.QFrame):
+    editing_started = QtCore.Signal(str)
     editing_finished = QtCore.Signal(str)
     text_changed = QtCore.Signal(str)
 
@@ -113,6 +114,8 @@ class EditableLabel(QtWidgets.QFrame):
 
         self.lineedit.setFocus()
 
+        self.editing_started.emit(self.text)
+
     def cancel_editing(self):
         self.editing_finished.emit(self.text)
         self.display()
@@ -1,26 +1,46 @@
 import datetime as dt
 import re
-from typing import Union, cast, Optional, Sequence
+import sys
+from typing import Collection, Union, cast, Optional
 
 from PySide6 import QtGui, QtWidgets, QtCore
 
-_valid_attribute_name_re = re.compile(r'^[A-Za-z][A-Za-z_0-9]*$')
+_valid_attribute_name_re = re.compile(r'[A-Za-z][A-Za-z_0-9]*')
+
+_float_re = re.compile(r'[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?', re.ASCII)
+# prefixes of the above - typing '-', '.', '1e-' must stay editable
+_float_prefix_re = re.compile(r'[-+]?\d*\.?\d*([eE][-+]?\d*)?', re.ASCII)
 
 
 class AttributeNameValidator(QtGui.QValidator):
-    def __init__(self, invalid_words: Sequence[str] = [], parent=None):
+    def __init__(self, invalid_words: Collection[str] = (), parent=None):
         super().__init__(parent)
-        self.invalid_words = invalid_words
+        self.invalid_words = frozenset(map(sys.intern, invalid_words))
+        self._current: Optional[str] = None
+
+    def set_invalid_words(self, invalid_words: Collection[str]) -> None:
+        self.invalid_words = frozenset(map(sys.intern, invalid_words))
+
+    @QtCore.Slot(str)
+    def set_current(self, word: Optional[str]) -> None:
+        # a validator shared between rows: the name currently being edited may
+        # collide with itself without being reported invalid
+        self._current = word
 
     def validate(self, word: str, pos: int) -> QtGui.QValidator.State:
+        # checks ordered cheapest first - this runs on every keystroke
         if len(word) == 0:
             return QtGui.QValidator.Intermediate  # type: ignore
 
-        if word in self.invalid_words:
+        if word in self.invalid_words and word != self._current:
             return QtGui.QValidator.Intermediate  # type: ignore
 
-        if not _valid_attribute_name_re.match(word):
-            return QtGui.QValidator.Intermediate  # type: ignore
+        # str.isidentifier runs in C and accepts most valid names without starting the
+        # regex engine; the regex stays authoritative for everything else (it is
+        # stricter: no leading underscore, ASCII only)
+        if word[0] == '_' or not word.isascii() or not word.isidentifier():
+            if not _valid_attribute_name_re.fullmatch(word):
+                return QtGui.QValidator.Intermediate  # type: ignore
 
         return QtGui.QValidator.Acceptable  # type: ignore
 
@@ -37,20 +57,37 @@ class IntDelegate(QtWidgets.QSpinBox):
         self.setValue(value)
 
 
+class FloatValidator(QtGui.QValidator):
+    # QDoubleValidator consults the locale on every keystroke; a precompiled regex is
+    # both faster and guarantees the text stays parseable by Python's float()
+    def validate(self, word: str, pos: int) -> QtGui.QValidator.State:
+        if _float_re.fullmatch(word):
+            return QtGui.QValidator.Acceptable  # type: ignore
+        if _float_prefix_re.fullmatch(word):
+            return QtGui.QValidator.Intermediate  # type: ignore
+        return QtGui.QValidator.Invalid  # type: ignore
+
+
 class FloatDelegate(QtWidgets.QLineEdit):
     def __init__(self, value: Union[float, None] = None, parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
 
-        validator = QtGui.QDoubleValidator(self)
-        validator.setNotation(QtGui.QDoubleValidator.Notation.ScientificNotation)
-        self.setValidator(validator)
+        self.setValidator(FloatValidator(self))
+
+        self._cached_text: Optional[str] = None
+        self._cached_value = 0.0
 
         if value is None:
             value = 0
         self.setText(str(value))
 
     def value(self) -> float:
-        return float(self.text())
+        # editingFinished-handlers may read the value more than once per commit
+        text = self.text()
+        if text != self._cached_text:
+            self._cached_value = float(text)
+            self._cached_text = text
+        return self._cached_value
 
     def set_value(self, value: float):
         self.setText(str(value))